@@ -7,7 +7,19 @@ class Config:
     MAX_GLOBAL_VERSIONS = 5  # Nombre maximal de versions globales
     MIN_FREE_SPACE_MB = 500  # Espace libre minimal en Mo avant nettoyage automatique
 
-    # Politiques spécifiques aux objets
+    # Politiques spécifiques aux objets (valeurs initiales du ConfigStore partagé)
+    # Clé : nom d'objet, préfixe terminé par "/" ou motif comme "logs/*.txt"
     OBJECT_POLICIES = {
         # Exemple : "plan-etat-de-l-art": 3
     }
+
+    # Règles de cycle de vie (valeurs initiales du ConfigStore partagé)
+    LIFECYCLE_RULES = {
+        # Exemple : "logs/": {"expiration_days": 30, "noncurrent_expiration_days": 7}
+    }
+    LIFECYCLE_BATCH_SIZE = 100  # Nombre d'expirations traitées par lot
+    LIFECYCLE_INTERVAL_SECONDS = 60  # Période de passage de l'expirateur
+    LIFECYCLE_LEASE_SECONDS = 300  # Durée de réservation d'un lot par un worker
+
+    ARCHIVE_CHUNK_SIZE = 1024 * 1024  # Taille des blocs lus lors d'un export tar
+    ARCHIVE_INDEX_BATCH_SIZE = 1000  # Objets ajoutés à l'index global par écriture
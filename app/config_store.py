@@ -0,0 +1,125 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+
+
+class ConfigStore:
+    """
+    Persistent runtime configuration (object policies, lifecycle rules...)
+    shared by every worker of the API.
+    Entries live in a SQLite database next to the objects. Each thread keeps a
+    cache of the entries, reloaded when SQLite's data_version (bumped by any
+    commit from another connection) changes, so reads only cost that pragma
+    on a connection kept open by each thread.
+    """
+
+    CONFIG_FILE = "config.db"
+    OBJECT_POLICIES = "object_policies"
+    LIFECYCLE_RULES = "lifecycle_rules"
+    WILDCARDS = "*?["
+
+    def __init__(self, base_path: str, defaults: dict = {}):
+        self.base_path = base_path
+        os.makedirs(self.base_path, exist_ok=True)
+        self.config_path = os.path.join(self.base_path, self.CONFIG_FILE)
+        # One reading connection and cache per thread, with the data_version
+        # the cache was read at, so a thread never replaces another's cache
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " section TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " PRIMARY KEY (section, key))"
+            )
+            # Defaults from Config only fill entries that were never set
+            for section, entries in defaults.items():
+                connection.executemany(
+                    "INSERT OR IGNORE INTO entries VALUES (?, ?, ?)",
+                    [
+                        (section, key, json.dumps(value))
+                        for key, value in entries.items()
+                    ],
+                )
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the store, commit and close it on exit."""
+        connection = sqlite3.connect(self.config_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _load(self) -> dict:
+        """Return all entries, reloading them only if the store changed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.config_path, timeout=30)
+            self._local.connection = connection
+            self._local.data_version = None
+            self._local.cache = {}
+        (data_version,) = connection.execute("PRAGMA data_version").fetchone()
+        if data_version != self._local.data_version:
+            cache = {}
+            rows = connection.execute("SELECT section, key, value FROM entries")
+            for section, key, value in rows:
+                cache.setdefault(section, {})[key] = json.loads(value)
+            self._local.cache = cache
+            self._local.data_version = data_version
+        return self._local.cache
+
+    def get_section(self, section: str) -> dict:
+        """Return a copy of every entry of a section."""
+        return dict(self._load().get(section, {}))
+
+    def get(self, section: str, key: str, default=None):
+        return self._load().get(section, {}).get(key, default)
+
+    # Writes use their own connection, so that the data_version of every
+    # reading connection (this thread's included) changes
+    def set(self, section: str, key: str, value):
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (section, key, json.dumps(value)),
+            )
+
+    def delete(self, section: str, key: str):
+        with self._connect() as connection:
+            deleted = connection.execute(
+                "DELETE FROM entries WHERE section = ? AND key = ?", (section, key)
+            ).rowcount
+            if not deleted:
+                raise KeyError(f"No entry '{key}' in '{section}'")
+
+    @classmethod
+    def key_matches(cls, key: str, object_name: str) -> bool:
+        """
+        A key (or prefix) matches an object if it is its name, a prefix ending
+        with a slash (a "folder"), or a wildcard pattern such as "logs/*.txt".
+        Every prefix of the API (policies, lifecycle rules, export) uses it.
+        """
+        if key == object_name:
+            return True
+        if any(char in key for char in cls.WILDCARDS):
+            return fnmatchcase(object_name, key)
+        return key.endswith("/") and object_name.startswith(key)
+
+    def match(self, section: str, object_name: str, default=None):
+        """
+        Return the entry of a section applying to an object.
+        The exact name wins, then the longest matching prefix or pattern.
+        """
+        entries = self._load().get(section, {})
+        if object_name in entries:
+            return entries[object_name]
+        matches = [key for key in entries if self.key_matches(key, object_name)]
+        if not matches:
+            return default
+        return entries[max(matches, key=len)]
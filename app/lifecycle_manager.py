@@ -0,0 +1,124 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from app.config_store import ConfigStore
+
+
+class LifecycleManager:
+    """
+    Keeps the time-ordered index of scheduled expirations.
+    Entries live in a SQLite table indexed by expiry time, so the expirer only
+    reads the entries that are due and never walks the namespace.
+    """
+
+    INDEX_FILE = "lifecycle.db"
+    CURRENT = "current"
+    NONCURRENT = "noncurrent"
+
+    # Rule key used for each kind of expiration
+    RULE_KEYS = {
+        CURRENT: "expiration_days",
+        NONCURRENT: "noncurrent_expiration_days",
+    }
+
+    def __init__(self, base_path: str, config_store: ConfigStore):
+        self.base_path = base_path
+        self.config_store = config_store
+        os.makedirs(self.base_path, exist_ok=True)
+        self.index_path = os.path.join(self.base_path, self.INDEX_FILE)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS expirations ("
+                " object_name TEXT NOT NULL,"
+                " version_id TEXT NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (object_name, version_id, kind))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS expirations_by_time"
+                " ON expirations (expires_at)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection to the index, commit and close it on exit.
+        One connection per call keeps the index usable from any thread.
+        """
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get_rule(self, object_name: str) -> dict:
+        """
+        Return the lifecycle rule applying to an object.
+        Rules are keyed by object name, prefix or pattern, see ConfigStore.match.
+        """
+        return self.config_store.match(ConfigStore.LIFECYCLE_RULES, object_name)
+
+    def get_expiration(self, object_name: str, kind: str, since: datetime):
+        """
+        Return the expiry date of a version, counted from `since`, or None if
+        no rule applies to it (or if the date is out of range, so that a bad
+        stored rule never breaks writes).
+        """
+        rule = self.get_rule(object_name)
+        if not rule or rule.get(self.RULE_KEYS[kind]) is None:
+            return None
+        try:
+            return since + timedelta(days=rule[self.RULE_KEYS[kind]])
+        except OverflowError:
+            return None
+
+    def schedule(self, entries: list[tuple]):
+        """
+        Add (or move) expirations in the index.
+        Each entry is (object_name, version_id, kind, since), versions without
+        a matching rule are ignored.
+        """
+        rows = []
+        for object_name, version_id, kind, since in entries:
+            expires_at = self.get_expiration(object_name, kind, since)
+            if expires_at is not None:
+                rows.append((object_name, version_id, kind, expires_at.timestamp()))
+        if not rows:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO expirations VALUES (?, ?, ?, ?)", rows
+            )
+
+    def claim_due(self, now: datetime, limit: int, lease_seconds: int) -> list[tuple]:
+        """
+        Return at most `limit` due expirations, oldest first, and push them
+        back by `lease_seconds` so that other workers do not process them too.
+        If the claiming worker dies, the entries are due again after the lease.
+        """
+        with self._connect() as connection:
+            # Take the write lock before reading to claim atomically
+            connection.execute("BEGIN IMMEDIATE")
+            due = connection.execute(
+                "SELECT object_name, version_id, kind FROM expirations"
+                " WHERE expires_at <= ? ORDER BY expires_at LIMIT ?",
+                (now.timestamp(), limit),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE expirations SET expires_at = ?"
+                " WHERE object_name = ? AND version_id = ? AND kind = ?",
+                [(now.timestamp() + lease_seconds, *entry) for entry in due],
+            )
+            return due
+
+    def remove(self, entries: list[tuple]):
+        """Remove a batch of processed expirations from the index."""
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM expirations"
+                " WHERE object_name = ? AND version_id = ? AND kind = ?",
+                entries,
+            )
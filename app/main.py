@@ -1,12 +1,38 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from app.routers import router
+from app.config import Config
+from app.routers import router, storage_manager
 
 HOST = "localhost"
 PORT = 8000
 
+
+async def run_expirer():
+    """Periodically expire the objects due according to the lifecycle rules."""
+    while True:
+        try:
+            await asyncio.to_thread(storage_manager.apply_lifecycle)
+        except Exception:
+            # Keep the expirer alive, remaining entries are retried next pass
+            logging.exception("Lifecycle expiration failed")
+        await asyncio.sleep(Config.LIFECYCLE_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    expirer = asyncio.create_task(run_expirer())
+    yield
+    expirer.cancel()
+    # Let the task process its cancellation so it is not left pending
+    with suppress(asyncio.CancelledError):
+        await expirer
+
+
 # Create FastAPI instance
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 # Exception handlers
@@ -15,6 +41,11 @@ async def not_found_exception_handler(request: Request, exc: FileNotFoundError):
     return JSONResponse(status_code=404, content={"message": str(exc)})
 
 
+@app.exception_handler(FileExistsError)
+async def already_exists_exception_handler(request: Request, exc: FileExistsError):
+    return JSONResponse(status_code=409, content={"message": str(exc)})
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     return JSONResponse(status_code=500, content={"message": str(exc)})
@@ -1,15 +1,25 @@
 import json
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows, only threads are synchronized
+    fcntl = None
+
 
 class MetadataManager:
     """Handles metadatas for objects stored in the storage manager."""
 
     METADATA_FILE = "metadata.json"
+    LOCK_FILE = "metadata.lock"
 
     def __init__(self, base_path: str):
         self.base_path = base_path
+        self._global_lock = threading.Lock()
         os.makedirs(self.base_path, exist_ok=True)
         # Create a metadata file for the base path if it doesn't exist
         metadata_path = self._get_metadata_path(self.base_path)
@@ -34,9 +44,24 @@ class MetadataManager:
         return current_metadata
 
     def _write_metadata(self, metadata_path: str, metadata: dict):
-        """Write the metadata to a file."""
-        with open(metadata_path, "w") as file:
-            json.dump(metadata, file)
+        """
+        Write the metadata to a file.
+        Write to a unique temporary file first so that readers never see a
+        partial file and concurrent writers do not share a temporary file.
+        """
+        # The prefix keeps the temporary file out of the version listing
+        descriptor, temporary_path = tempfile.mkstemp(
+            prefix=f"{self.METADATA_FILE}.",
+            suffix=".tmp",
+            dir=os.path.dirname(metadata_path),
+        )
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(metadata, file)
+            os.replace(temporary_path, metadata_path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
 
     def get_current_version(self, object_name: str) -> str:
         """Return the version ID of the current version of an object."""
@@ -97,23 +122,48 @@ class MetadataManager:
     # Global metadata operations
     # We keep list of all objects and global parameters (number of versions, etc.)
     def add_object(self, object_name: str):
-        global_metadata = self.read_metadata(self.base_path)
-        if "objects" not in global_metadata:
-            global_metadata["objects"] = {}
-        global_metadata["objects"].update({object_name: {}})
+        self.add_objects([object_name])
 
-        global_metadata_path = self._get_metadata_path(self.base_path)
-        self._write_metadata(global_metadata_path, global_metadata)
+    @contextmanager
+    def _update_global_metadata(self):
+        """
+        Read the global metadata, let the caller change it, then write it.
+        The read-modify-write is locked across threads and, with an exclusive
+        lock on a lock file, across the workers of the API.
+        """
+        with self._global_lock:
+            with open(os.path.join(self.base_path, self.LOCK_FILE), "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                global_metadata = self.read_metadata(self.base_path)
+                global_metadata.setdefault("objects", {})
+                yield global_metadata
+                global_metadata_path = self._get_metadata_path(self.base_path)
+                self._write_metadata(global_metadata_path, global_metadata)
+                # The lock is released when the file is closed
+
+    def add_objects(self, object_names: list[str]):
+        """Add several objects to the global metadata in a single write."""
+        with self._update_global_metadata() as global_metadata:
+            for object_name in object_names:
+                global_metadata["objects"].setdefault(object_name, {})
+
+    def rename_objects(self, renames: dict):
+        """Rename objects in the global metadata in a single write."""
+        with self._update_global_metadata() as global_metadata:
+            for old_name, new_name in renames.items():
+                global_metadata["objects"][new_name] = global_metadata["objects"].pop(
+                    old_name, {}
+                )
 
     def delete_object(self, object_path: str, object_name: str):
         # Delete metadata file
         metadata_path = self._get_metadata_path(object_path)
         os.remove(metadata_path)
         # Remove object from global metadata
-        global_metadata = self.read_metadata(self.base_path)
-        global_metadata["objects"].pop(object_name)
-        global_metadata_path = self._get_metadata_path(self.base_path)
-        self._write_metadata(global_metadata_path, global_metadata)
+        with self._update_global_metadata() as global_metadata:
+            # May already be removed by another worker (expirer)
+            global_metadata["objects"].pop(object_name, None)
 
     def list_objects(self) -> list:
         metadata = self.read_metadata(self.base_path)
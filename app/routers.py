@@ -1,13 +1,18 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from fastapi.responses import Response
+import asyncio
+import io
+import tarfile
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File
+from fastapi.responses import Response, StreamingResponse
 from app.storage_manager import StorageManager
 from app.config import Config
+from app.config_store import ConfigStore
 
 
 router = APIRouter()
 data_dir = "data"
 storage_manager = StorageManager(base_path=data_dir)
 metadata_manager = storage_manager.metadata_manager
+config_store = storage_manager.config_store
 
 
 # Object name can contain any character, including slashes
@@ -73,6 +78,118 @@ def delete_object(object_name: str, version_id: str = None):
         return {"message": f"All versions of object '{object_name}' have been deleted."}
 
 
+# Server-side operations, the data never leaves the disk
+@router.post("/copy/{source:path}")
+def copy_object(source: str, destination: str, version_id: str = None):
+    """
+    Copy the current (or given) version of an object to another object.
+    """
+    new_version_id = storage_manager.copy_object(source, destination, version_id)
+    return {
+        "message": f"Object '{source}' has been copied to '{destination}'.",
+        "version_id": new_version_id,
+    }
+
+
+@router.post("/move/{source:path}")
+def move_object(source: str, destination: str, prefix: bool = False):
+    """
+    Rename an object with all its versions.
+    If prefix is True, rename every object under the source prefix, both
+    prefixes ending with "/".
+    """
+    if prefix:
+        try:
+            objects = storage_manager.move_prefix(source, destination)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {
+            "message": f"Objects under '{source}' have been moved to '{destination}'.",
+            "objects": objects,
+        }
+    storage_manager.move_object(source, destination)
+    return {"message": f"Object '{source}' has been moved to '{destination}'."}
+
+
+@router.post("/restore/{object_name:path}")
+def restore_version(object_name: str, version_id: str):
+    """
+    Make an old version of an object the current one.
+    """
+    new_version_id = storage_manager.restore_version(object_name, version_id)
+    return {
+        "message": f"Version '{version_id}' of object '{object_name}' has been restored.",
+        "version_id": new_version_id,
+    }
+
+
+class RequestBodyReader(io.RawIOBase):
+    """
+    Blocking file-like view of a request body, to be read from a worker
+    thread while the event loop receives the body. Only the last received
+    chunk is kept in memory.
+    """
+
+    def __init__(self, request: Request, loop: asyncio.AbstractEventLoop):
+        self.chunks = request.stream()
+        self.loop = loop
+        self.buffer = b""
+
+    async def _next_chunk(self):
+        try:
+            return await self.chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.buffer:
+            chunk = asyncio.run_coroutine_threadsafe(
+                self._next_chunk(), self.loop
+            ).result()
+            if chunk is None:
+                return 0
+            self.buffer = chunk
+        size = min(len(buffer), len(self.buffer))
+        buffer[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+# Tar export/import of every object under a prefix, with metadata
+@router.get("/archive")
+def export_archive(prefix: str = "", with_versions: bool = False):
+    """
+    Stream a tar archive of the objects matching a prefix (an object name,
+    a prefix ending with "/" or a pattern) and their metadata.
+    If with_versions is True, include all versions of each object.
+    """
+    return StreamingResponse(
+        storage_manager.export_archive(prefix, with_versions),
+        media_type="application/x-tar",
+        headers={"Content-Disposition": 'attachment; filename="objects.tar"'},
+    )
+
+
+@router.put("/archive")
+async def import_archive(request: Request):
+    """
+    Store the objects of a tar archive sent as the request body (optionally
+    compressed), as produced by GET /archive.
+    """
+    reader = RequestBodyReader(request, asyncio.get_running_loop())
+    try:
+        objects = await asyncio.to_thread(storage_manager.import_archive, reader)
+    except (tarfile.TarError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "message": f"{len(objects)} objects have been imported.",
+        "objects": objects,
+    }
+
+
 # put arbitrary key/value pairs in the metadata of an object
 @router.put("/metadata/{object_name:path}")
 async def update_metadata(object_name: str, metadata: dict):
@@ -95,24 +212,35 @@ async def delete_metadata(object_name: str, keys: list[str]):
     return {"message": f"Metadata keys {keys} deleted for object '{object_name}'."}
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class ObjectPolicyUpdate(BaseModel):
-    max_versions: int
+    # At least the version just written must be kept
+    max_versions: int = Field(ge=1)
 
 
-@router.put("/config/object-policy/{object_name}")
+@router.put("/config/object-policy/{object_name:path}")
 def update_object_policy(object_name: str, policy: ObjectPolicyUpdate):
     """
     Update the versioning policy for a specific object.
+    The name can also be a prefix ending with "/" or a pattern like "logs/*".
     """
-    Config.OBJECT_POLICIES[object_name] = policy.max_versions
+    config_store.set(ConfigStore.OBJECT_POLICIES, object_name, policy.max_versions)
     return {
         "message": f"Policy for '{object_name}' updated to keep max {policy.max_versions} versions"
     }
 
 
+@router.delete("/config/object-policy/{object_name:path}")
+def delete_object_policy(object_name: str):
+    try:
+        config_store.delete(ConfigStore.OBJECT_POLICIES, object_name)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"No policy for '{object_name}'")
+    return {"message": f"Policy for '{object_name}' deleted"}
+
+
 @router.get("/config/object-policies")
 def list_object_policies():
     """
@@ -121,5 +249,56 @@ def list_object_policies():
     return {
         "global_max_versions": Config.MAX_GLOBAL_VERSIONS,
         "min_free_space_mb": Config.MIN_FREE_SPACE_MB,
-        "object_policies": Config.OBJECT_POLICIES,
+        "object_policies": config_store.get_section(ConfigStore.OBJECT_POLICIES),
     }
+
+
+class LifecycleRuleUpdate(BaseModel):
+    expiration_days: int | None = Field(default=None, ge=0, le=36500)
+    noncurrent_expiration_days: int | None = Field(default=None, ge=0, le=36500)
+
+    @model_validator(mode="after")
+    def check_not_empty(self):
+        if self.expiration_days is None and self.noncurrent_expiration_days is None:
+            raise ValueError(
+                "expiration_days or noncurrent_expiration_days is required"
+            )
+        return self
+
+
+@router.put("/config/lifecycle-rule/{prefix:path}")
+def update_lifecycle_rule(prefix: str, rule: LifecycleRuleUpdate):
+    """
+    Set the lifecycle rule of an object, of every object under a prefix ending
+    with "/", or of the objects matching a pattern like "logs/*".
+    Objects already stored that match are scheduled for expiration.
+    """
+    config_store.set(ConfigStore.LIFECYCLE_RULES, prefix, rule.model_dump())
+    storage_manager.schedule_lifecycle_prefix(prefix)
+    return {
+        "message": f"Lifecycle rule for '{prefix}' updated",
+        "rule": rule.model_dump(),
+    }
+
+
+@router.delete("/config/lifecycle-rule/{prefix:path}")
+def delete_lifecycle_rule(prefix: str):
+    try:
+        config_store.delete(ConfigStore.LIFECYCLE_RULES, prefix)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"No lifecycle rule for '{prefix}'")
+    return {"message": f"Lifecycle rule for '{prefix}' deleted"}
+
+
+@router.get("/config/lifecycle-rules")
+def list_lifecycle_rules():
+    return {"lifecycle_rules": config_store.get_section(ConfigStore.LIFECYCLE_RULES)}
+
+
+@router.post("/config/lifecycle/expire")
+def expire_objects():
+    """
+    Run the expirer now instead of waiting for the next periodic pass.
+    """
+    processed = storage_manager.apply_lifecycle()
+    return {"message": f"{processed} scheduled expirations processed"}
@@ -1,10 +1,23 @@
+import io
+import json
 import os
+import tarfile
+import tempfile
 import uuid
 from datetime import datetime
 from app.metadata_manager import MetadataManager
+from app.lifecycle_manager import LifecycleManager
+from app.config_store import ConfigStore
 from app.config import Config
 import shutil
 
+try:
+    import fcntl
+except ImportError:  # Windows, no reflink support
+    fcntl = None
+
+FICLONE = 0x40049409  # Linux ioctl sharing the extents of a file (reflink)
+
 
 class StorageManager:
     """
@@ -16,9 +29,17 @@ class StorageManager:
         self.base_path = base_path
         # self.base_path = Config.BASE_PATH
         self.max_global_versions = Config.MAX_GLOBAL_VERSIONS
-        self.object_policies = Config.OBJECT_POLICIES
         os.makedirs(self.base_path, exist_ok=True)
         self.metadata_manager = MetadataManager(base_path)
+        # Policies are shared by all workers through the config store
+        self.config_store = ConfigStore(
+            base_path,
+            {
+                ConfigStore.OBJECT_POLICIES: Config.OBJECT_POLICIES,
+                ConfigStore.LIFECYCLE_RULES: Config.LIFECYCLE_RULES,
+            },
+        )
+        self.lifecycle_manager = LifecycleManager(base_path, self.config_store)
 
     def _get_object_path(self, object_name: str) -> str:
         """
@@ -37,7 +58,9 @@ class StorageManager:
             raise FileNotFoundError(f"Object '{object_name}' not found")
 
         # Récupérer la limite de versions pour cet objet ou utiliser la limite globale
-        max_versions = self.object_policies.get(object_name, self.max_global_versions)
+        max_versions = self.config_store.match(
+            ConfigStore.OBJECT_POLICIES, object_name, self.max_global_versions
+        )
 
         # Lister et supprimer les versions si nécessaire
         versions = self._get_all_versions(object_dir)
@@ -46,6 +69,107 @@ class StorageManager:
                 version_path = self._get_version_path(object_name, version)
                 os.remove(version_path)
 
+    def _get_lifecycle_entries(self, object_name: str) -> list[tuple]:
+        """
+        Return the expirations to schedule for every version of an object.
+        A version becomes noncurrent when the next version is written.
+        """
+        versions = self.list_versions(object_name)
+        entries = []
+        for index, version in enumerate(versions):
+            if index == 0:
+                since = self._get_version_time(version)
+                kind = LifecycleManager.CURRENT
+            else:
+                since = self._get_version_time(versions[index - 1])
+                kind = LifecycleManager.NONCURRENT
+            entries.append((object_name, version, kind, since))
+        return entries
+
+    def schedule_lifecycle(self, object_name: str):
+        """
+        Schedule the expirations of every version of an object according to
+        its lifecycle rule.
+        """
+        self.lifecycle_manager.schedule(self._get_lifecycle_entries(object_name))
+
+    def schedule_lifecycle_prefix(self, prefix: str):
+        """
+        Schedule the expirations of the objects already stored that match a
+        lifecycle rule key (see ConfigStore.key_matches), by batches of
+        Config.LIFECYCLE_BATCH_SIZE entries.
+        Used when a lifecycle rule is added, new writes are scheduled directly.
+        """
+        entries = []
+        for object_name in self.metadata_manager.list_objects():
+            if ConfigStore.key_matches(prefix, object_name):
+                entries += self._get_lifecycle_entries(object_name)
+            if len(entries) >= Config.LIFECYCLE_BATCH_SIZE:
+                self.lifecycle_manager.schedule(entries)
+                entries = []
+        self.lifecycle_manager.schedule(entries)
+
+    def _expire_version(self, object_name: str, version_id: str, kind: str, now):
+        """
+        Handle one due expiration and return the expirations to schedule
+        afterwards: the entry itself if its rule changed and it must stay
+        longer.
+        The expiration of the current version removes the whole object, the
+        expiration of a noncurrent version only removes that version.
+        Stale entries (version deleted, or no longer current/noncurrent) are
+        dropped.
+        """
+        object_dir = self._get_object_path(object_name)
+        if not os.path.exists(self._get_version_path(object_name, version_id)):
+            return []
+        versions = self._get_all_versions(object_dir)
+        index = versions.index(version_id)
+        if kind == LifecycleManager.CURRENT:
+            if index != 0:
+                return []
+            since = self._get_version_time(version_id)
+        else:
+            if index == 0:
+                return []
+            since = self._get_version_time(versions[index - 1])
+
+        expires_at = self.lifecycle_manager.get_expiration(object_name, kind, since)
+        if expires_at is None:
+            return []
+        if expires_at > now:
+            return [(object_name, version_id, kind, since)]
+
+        if kind == LifecycleManager.CURRENT:
+            # Never bring an older version back as the current one
+            self.delete_object(object_name)
+        else:
+            self.delete_object(object_name, version_id)
+        return []
+
+    def apply_lifecycle(self, now: datetime = None) -> int:
+        """
+        Expire the versions that are due according to the lifecycle rules.
+        Due entries are claimed from the expiration index by batches of
+        Config.LIFECYCLE_BATCH_SIZE, so several workers can run the expirer.
+        Return the number of processed entries.
+        """
+        now = now or datetime.now()
+        processed = 0
+        while True:
+            due = self.lifecycle_manager.claim_due(
+                now, Config.LIFECYCLE_BATCH_SIZE, Config.LIFECYCLE_LEASE_SECONDS
+            )
+            if not due:
+                break
+            to_schedule = []
+            for object_name, version_id, kind in due:
+                to_schedule += self._expire_version(object_name, version_id, kind, now)
+            # Remove the batch first, postponed entries are scheduled again
+            self.lifecycle_manager.remove(due)
+            self.lifecycle_manager.schedule(to_schedule)
+            processed += len(due)
+        return processed
+
     def check_and_free_space(self):
         """
         Check available disk space and free it if below the minimum threshold.
@@ -72,12 +196,14 @@ class StorageManager:
 
     def _get_all_versions(self, object_path: str) -> str:
         """Return sorted list of all versions path of an object."""
+        # Skip the metadata file and its temporary copy while it is rewritten
+        metadata_file = self.metadata_manager.METADATA_FILE
         versions = [
             f
             for f in os.listdir(object_path)
             if os.path.isfile(os.path.join(object_path, f))
+            and not f.startswith(metadata_file)
         ]
-        versions.remove(self.metadata_manager.METADATA_FILE)
         versions.sort(reverse=True)
         return versions
 
@@ -93,6 +219,11 @@ class StorageManager:
         unique_id = uuid.uuid4().hex
         return f"{timestamp}-{unique_id}"
 
+    def _get_version_time(self, version_id: str) -> datetime:
+        """Return the creation date of a version, read from its ID."""
+        timestamp = version_id.rsplit("-", 1)[0]
+        return datetime.strptime(timestamp, "%Y%m%d%H%M%S-%f")
+
     def get_current_version(self, object_name: str) -> str:
         """Return the version ID of the current version of an object."""
         object_path = self._get_object_path(object_name)
@@ -110,16 +241,138 @@ class StorageManager:
         version_path = self._get_version_path(object_name, version_id)
         with open(version_path, "wb") as file:
             file.write(data)
+        self._commit_version(object_name, version_id, metadata)
+
+        return version_id
+
+    def _commit_version(self, object_name: str, version_id: str, metadata: dict):
+        """Make a newly stored version the current version of an object."""
+        object_path = self._get_object_path(object_name)
         # Update metadata
         self.metadata_manager.update_metadata(object_path, metadata, version_id)
         self.metadata_manager.add_object(object_name)
 
         # Appliquer la politique de versionnement
         self.apply_policy(object_name)
+        # Planifier les expirations du cycle de vie
+        self.schedule_lifecycle(object_name)
         # Vérifier l'espace disque disponible
         self.check_and_free_space()
 
-        return version_id
+    def _clone_file(self, source_path: str, destination_path: str):
+        """
+        Give a version file a second path without moving its bytes.
+        Versions are never modified once written, so a hard link is safe.
+        Fall back to a reflink, then to a copy done by the kernel
+        (copy_file_range, or sendfile used by shutil).
+        """
+        try:
+            os.link(source_path, destination_path)
+            return
+        except OSError:
+            pass
+        with open(source_path, "rb") as source, open(destination_path, "wb") as dest:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dest.fileno(), FICLONE, source.fileno())
+                    return
+                except OSError:
+                    pass
+            if hasattr(os, "copy_file_range"):
+                try:
+                    remaining = os.fstat(source.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            source.fileno(), dest.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    return
+                except OSError:
+                    pass
+        shutil.copyfile(source_path, destination_path)
+
+    def copy_object(self, source: str, destination: str, version_id: str = None) -> str:
+        """
+        Copy the current (or given) version of an object as a new version of
+        another object, without reading the data. Return the new version ID.
+        """
+        source_versions = self.list_versions(source)
+        version_id = version_id or source_versions[0]
+        if version_id not in source_versions:
+            raise FileNotFoundError(
+                f"Version '{version_id}' of object '{source}' not found"
+            )
+        metadata = self.metadata_manager.read_metadata(self._get_object_path(source))
+        metadata.pop("version_id", None)
+        metadata.pop("last_modified", None)
+
+        os.makedirs(self._get_object_path(destination), exist_ok=True)
+        new_version_id = self._generate_version_id()
+        self._clone_file(
+            self._get_version_path(source, version_id),
+            self._get_version_path(destination, new_version_id),
+        )
+        self._commit_version(destination, new_version_id, metadata)
+        return new_version_id
+
+    def restore_version(self, object_name: str, version_id: str) -> str:
+        """
+        Make an old version the current one again. The version is kept in the
+        history and linked as a new version. Return the new version ID.
+        """
+        return self.copy_object(object_name, object_name, version_id)
+
+    def _move_objects(self, renames: dict):
+        """
+        Move objects (all versions and metadata) to new names.
+        Files are renamed, then the global metadata is updated in one write.
+        """
+        existing = set(self.list_objects())
+        for source, destination in renames.items():
+            if source not in existing:
+                raise FileNotFoundError(f"Object '{source}' not found")
+            if destination in existing:
+                raise FileExistsError(f"Object '{destination}' already exists")
+
+        for source, destination in renames.items():
+            source_path = self._get_object_path(source)
+            destination_path = self._get_object_path(destination)
+            os.makedirs(destination_path, exist_ok=True)
+            files = self._get_all_versions(source_path)
+            files.append(self.metadata_manager.METADATA_FILE)
+            for file_name in files:
+                os.rename(
+                    os.path.join(source_path, file_name),
+                    os.path.join(destination_path, file_name),
+                )
+            self._delete_empty_dirs(source_path)
+        self.metadata_manager.rename_objects(renames)
+
+        for destination in renames.values():
+            self.schedule_lifecycle(destination)
+
+    def move_object(self, source: str, destination: str):
+        """Rename an object, keeping all its versions and metadata."""
+        self._move_objects({source: destination})
+
+    def move_prefix(self, source_prefix: str, destination_prefix: str) -> list[str]:
+        """
+        Rename every object under a prefix (a "folder"). Return the new names.
+        Both prefixes must end with a slash, as the prefixes of policies.
+        """
+        if not source_prefix.endswith("/") or not destination_prefix.endswith("/"):
+            raise ValueError("Prefixes of a move must end with '/'")
+        renames = {
+            object_name: destination_prefix + object_name[len(source_prefix) :]
+            for object_name in self.list_objects()
+            if object_name.startswith(source_prefix)
+        }
+        if not renames:
+            raise FileNotFoundError(f"No object found under '{source_prefix}'")
+        self._move_objects(renames)
+        return list(renames.values())
 
     def read_object(self, object_name: str, version_id: str = None) -> bytes:
         """Read the data from a file with the given object name."""
@@ -206,3 +459,170 @@ class StorageManager:
         results = self.metadata_manager.filter_objects_by_metadata(key, exists, value)
 
         return results
+
+    # Archive operations
+    # The tar layout mirrors the storage: "<object_name>/<version_id>" for each
+    # version, then "<object_name>/metadata.json"
+    def _tar_member(self, name: str, file, size: int, mtime: float):
+        """Generate the tar blocks of one member, reading the file by chunks."""
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = mtime
+        yield info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+        remaining = size
+        while remaining > 0:
+            chunk = file.read(min(Config.ARCHIVE_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise OSError(f"File of member '{name}' is truncated")
+            remaining -= len(chunk)
+            yield chunk
+        yield tarfile.NUL * (-size % tarfile.BLOCKSIZE)
+
+    def export_archive(self, prefix: str = "", with_versions: bool = False):
+        """
+        Generate a tar stream of the objects matching a prefix (an object
+        name, a "folder/" or a pattern, all objects if empty) with their
+        metadata, only the current version unless with_versions is True.
+        The archive is built on the fly, only one chunk is held in memory.
+        """
+        for object_name in self.list_objects():
+            if prefix and not ConfigStore.key_matches(prefix, object_name):
+                continue
+            object_path = self._get_object_path(object_name)
+            versions = self._get_all_versions(object_path)
+            if not with_versions:
+                versions = versions[:1]
+            # Oldest first, so that the import sees versions in write order
+            for version in reversed(versions):
+                try:
+                    file = open(self._get_version_path(object_name, version), "rb")
+                except FileNotFoundError:
+                    # Deleted by a policy since the listing
+                    continue
+                with file:
+                    yield from self._tar_member(
+                        f"{object_name}/{version}",
+                        file,
+                        os.fstat(file.fileno()).st_size,
+                        self._get_version_time(version).timestamp(),
+                    )
+            metadata = self.metadata_manager.read_metadata(object_path)
+            data = json.dumps(metadata).encode()
+            yield from self._tar_member(
+                f"{object_name}/{self.metadata_manager.METADATA_FILE}",
+                io.BytesIO(data),
+                len(data),
+                datetime.now().timestamp(),
+            )
+        # End of archive: two empty blocks
+        yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+
+    def _split_member_name(self, name: str) -> tuple[str, str]:
+        """
+        Return the object name and file name (version ID or metadata file) of
+        a tar member. Reject names that would escape the base path.
+        Top-level files (global metadata, databases) have no object name.
+        """
+        name = os.path.normpath(name.lstrip("/"))
+        if name.startswith("..") or os.path.isabs(name):
+            raise ValueError(f"Invalid member name '{name}' in archive")
+        object_name, _, file_name = name.rpartition("/")
+        if object_name and file_name != self.metadata_manager.METADATA_FILE:
+            # Raise ValueError if the name is not a version ID
+            self._get_version_time(file_name)
+        return object_name, file_name
+
+    def _finish_import(self, pending: dict):
+        """
+        Index a batch of imported objects: add them to the global metadata,
+        set their metadata, apply their policies, then schedule their
+        expirations in a single write to the lifecycle index.
+        `pending` maps object names to the metadata read from the archive.
+        """
+        if not pending:
+            return
+        self.metadata_manager.add_objects(list(pending))
+        entries = []
+        for object_name, metadata in pending.items():
+            object_path = self._get_object_path(object_name)
+            versions = self._get_all_versions(object_path)
+            # Imported versions are merged with the existing ones
+            metadata["version_id"] = versions[0]
+            self.metadata_manager.update_metadata(object_path, metadata)
+            self.apply_policy(object_name)
+            entries += self._get_lifecycle_entries(object_name)
+        self.lifecycle_manager.schedule(entries)
+
+    def _import_version(self, object_name: str, version_id: str, data):
+        """
+        Store a version read from an archive.
+        Versions are never modified once written (they may be hard links
+        shared with copies), so an existing version ID is kept as is. New
+        versions are written to a temporary file first, a truncated archive
+        never leaves a partial version.
+        """
+        version_path = self._get_version_path(object_name, version_id)
+        if os.path.exists(version_path):
+            return
+        descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=self.base_path)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                shutil.copyfileobj(data, file, Config.ARCHIVE_CHUNK_SIZE)
+            os.makedirs(self._get_object_path(object_name), exist_ok=True)
+            os.replace(temporary_path, version_path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def import_archive(self, fileobj) -> list[str]:
+        """
+        Store the objects of a tar stream (as produced by export_archive),
+        keeping their version IDs. Versions already stored are skipped.
+        The stream is read sequentially and never spooled; the global
+        metadata is updated by batches.
+        Return the names of the imported objects.
+        """
+        imported = []
+        seen = set()  # Objects already in `imported`
+        pending = {}  # Objects not indexed yet, with their archive metadata
+        try:
+            with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+                    object_name, file_name = self._split_member_name(member.name)
+                    if not object_name:
+                        continue
+                    if file_name == self.metadata_manager.METADATA_FILE:
+                        if object_name not in pending:
+                            # Metadata of an object without versions in the archive
+                            continue
+                        metadata = json.load(archive.extractfile(member))
+                        if not isinstance(metadata, dict):
+                            raise ValueError(
+                                f"Invalid metadata for object '{object_name}'"
+                            )
+                        pending[object_name] = metadata
+                        continue
+
+                    if (
+                        object_name not in pending
+                        and len(pending) >= Config.ARCHIVE_INDEX_BATCH_SIZE
+                    ):
+                        # Flush before a new object, so that the metadata member
+                        # following the versions of the last one is kept
+                        self._finish_import(pending)
+                        pending = {}
+                    self._import_version(
+                        object_name, file_name, archive.extractfile(member)
+                    )
+                    # Members of an object may be split up in the archive
+                    pending.setdefault(object_name, {})
+                    if object_name not in seen:
+                        seen.add(object_name)
+                        imported.append(object_name)
+        finally:
+            # Index the objects already written, even if the stream failed
+            self._finish_import(pending)
+        self.check_and_free_space()
+        return imported
@@ -74,6 +74,64 @@ def delete_object(object_name, version_id=None):
         print(f"Error during DELETE request: {e}")
 
 
+# Server-side operations
+def copy_object(source, destination, version_id=None):
+    try:
+        params = {"destination": destination}
+        if version_id:
+            params["version_id"] = version_id
+        response = requests.post(f"{BASE_URL}/copy/{source}", params=params)
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during COPY request: {e}")
+
+
+def move_object(source, destination, prefix=False):
+    try:
+        params = {"destination": destination, "prefix": prefix}
+        response = requests.post(f"{BASE_URL}/move/{source}", params=params)
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during MOVE request: {e}")
+
+
+def restore_version(object_name, version_id):
+    try:
+        params = {"version_id": version_id}
+        response = requests.post(f"{BASE_URL}/restore/{object_name}", params=params)
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during RESTORE request: {e}")
+
+
+# Archive operations
+def export_objects(output_path, prefix=None, with_versions=False):
+    try:
+        params = {"with_versions": with_versions}
+        if prefix:
+            params["prefix"] = prefix
+        response = requests.get(f"{BASE_URL}/archive", params=params, stream=True)
+        if response.status_code != 200:
+            handle_response(response)
+            return
+        with open(output_path, "wb") as file:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                file.write(chunk)
+        print(f"Objects exported to '{output_path}'")
+    except Exception as e:
+        print(f"Error during EXPORT request: {e}")
+
+
+def import_objects(archive_path):
+    try:
+        # Passing the file object streams the archive instead of loading it
+        with open(archive_path, "rb") as file:
+            response = requests.put(f"{BASE_URL}/archive", data=file)
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during IMPORT request: {e}")
+
+
 # Metadata operations
 def update_metadata(object_name, metadata):
     try:
@@ -113,6 +171,14 @@ def update_policy(object_name, max_versions):
         print(f"Error during UPDATE POLICY request: {e}")
 
 
+def delete_policy(object_name):
+    try:
+        response = requests.delete(f"{BASE_URL}/config/object-policy/{object_name}")
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during DELETE POLICY request: {e}")
+
+
 def list_policies():
     try:
         response = requests.get(f"{BASE_URL}/config/object-policies")
@@ -121,6 +187,45 @@ def list_policies():
         print(f"Error during LIST POLICIES request: {e}")
 
 
+# Lifecycle operations
+def update_lifecycle_rule(prefix, expiration_days, noncurrent_expiration_days):
+    try:
+        response = requests.put(
+            f"{BASE_URL}/config/lifecycle-rule/{prefix}",
+            json={
+                "expiration_days": expiration_days,
+                "noncurrent_expiration_days": noncurrent_expiration_days,
+            },
+        )
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during UPDATE LIFECYCLE RULE request: {e}")
+
+
+def delete_lifecycle_rule(prefix):
+    try:
+        response = requests.delete(f"{BASE_URL}/config/lifecycle-rule/{prefix}")
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during DELETE LIFECYCLE RULE request: {e}")
+
+
+def list_lifecycle_rules():
+    try:
+        response = requests.get(f"{BASE_URL}/config/lifecycle-rules")
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during LIST LIFECYCLE RULES request: {e}")
+
+
+def expire_objects():
+    try:
+        response = requests.post(f"{BASE_URL}/config/lifecycle/expire")
+        handle_response(response)
+    except Exception as e:
+        print(f"Error during EXPIRE request: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Client for Object Store API")
     command_parser = parser.add_subparsers(dest="command", help="Available commands")
@@ -165,6 +270,58 @@ def main():
         "--version_id", type=str, help="Specific version ID to delete"
     )
 
+    # COPY, MOVE and RESTORE commands
+    copy_parser = command_parser.add_parser(
+        "copy", help="Copy an object on the server side"
+    )
+    copy_parser.add_argument("source", type=str, help="Name of the source object")
+    copy_parser.add_argument(
+        "destination", type=str, help="Name of the destination object"
+    )
+    copy_parser.add_argument(
+        "--version_id", type=str, help="Specific version ID to copy"
+    )
+
+    move_parser = command_parser.add_parser(
+        "move", help="Rename an object, or every object under a prefix"
+    )
+    move_parser.add_argument("source", type=str, help="Name or prefix to move")
+    move_parser.add_argument("destination", type=str, help="New name or prefix")
+    move_parser.add_argument(
+        "--prefix",
+        action="store_true",
+        help="Move every object under the prefix (both ending with '/')",
+    )
+
+    restore_parser = command_parser.add_parser(
+        "restore", help="Make an old version the current one"
+    )
+    restore_parser.add_argument("object_name", type=str, help="Name of the object")
+    restore_parser.add_argument("version_id", type=str, help="Version ID to restore")
+
+    # EXPORT and IMPORT commands
+    export_parser = command_parser.add_parser(
+        "export", help="Download objects and their metadata as a tar archive"
+    )
+    export_parser.add_argument(
+        "output_path", type=str, help="Path to save the tar archive"
+    )
+    export_parser.add_argument(
+        "--prefix",
+        type=str,
+        help="Only export this object, prefix ending with '/' or pattern",
+    )
+    export_parser.add_argument(
+        "--with_versions", action="store_true", help="Export all versions"
+    )
+
+    import_parser = command_parser.add_parser(
+        "import", help="Upload objects from a tar archive made by 'export'"
+    )
+    import_parser.add_argument(
+        "archive_path", type=str, help="Path to the tar archive (.tar or .tar.gz)"
+    )
+
     # METADATA commands
     mget_parser = command_parser.add_parser(
         "mget", help="Retrieve metadata of an object"
@@ -197,15 +354,42 @@ def main():
     # POLICY commands
     policy_parser = command_parser.add_parser("policy", help="Policy operations")
     policy_parser.add_argument(
-        "operation", choices=["update", "list"], help="Policy operation"
+        "operation", choices=["update", "delete", "list"], help="Policy operation"
     )
     policy_parser.add_argument(
-        "--object_name", type=str, help="Object name (for 'update')"
+        "--object_name",
+        type=str,
+        help="Object name, prefix ending with '/' or pattern (for 'update'/'delete')",
     )
     policy_parser.add_argument(
         "--max_versions", type=int, help="Maximum versions to keep (for 'update')"
     )
 
+    # LIFECYCLE commands
+    lifecycle_parser = command_parser.add_parser(
+        "lifecycle", help="Lifecycle rule operations"
+    )
+    lifecycle_parser.add_argument(
+        "operation",
+        choices=["update", "delete", "list", "expire"],
+        help="Lifecycle operation",
+    )
+    lifecycle_parser.add_argument(
+        "--prefix",
+        type=str,
+        help="Object name, prefix ending with '/' or pattern (for 'update'/'delete')",
+    )
+    lifecycle_parser.add_argument(
+        "--expiration_days",
+        type=int,
+        help="Days before the current version expires (for 'update')",
+    )
+    lifecycle_parser.add_argument(
+        "--noncurrent_expiration_days",
+        type=int,
+        help="Days before noncurrent versions expire (for 'update')",
+    )
+
     args = parser.parse_args()
 
     if args.command == "put":
@@ -216,6 +400,16 @@ def main():
         list_objects(args.with_versions, args.key, args.value, args.exists)
     elif args.command == "delete":
         delete_object(args.object_name, args.version_id)
+    elif args.command == "copy":
+        copy_object(args.source, args.destination, args.version_id)
+    elif args.command == "move":
+        move_object(args.source, args.destination, args.prefix)
+    elif args.command == "restore":
+        restore_version(args.object_name, args.version_id)
+    elif args.command == "export":
+        export_objects(args.output_path, args.prefix, args.with_versions)
+    elif args.command == "import":
+        import_objects(args.archive_path)
     elif args.command == "mget":
         get_metadata(args.object_name)
     elif args.command == "mput":
@@ -225,8 +419,21 @@ def main():
     elif args.command == "policy":
         if args.operation == "update":
             update_policy(args.object_name, args.max_versions)
+        elif args.operation == "delete":
+            delete_policy(args.object_name)
         elif args.operation == "list":
             list_policies()
+    elif args.command == "lifecycle":
+        if args.operation == "update":
+            update_lifecycle_rule(
+                args.prefix, args.expiration_days, args.noncurrent_expiration_days
+            )
+        elif args.operation == "delete":
+            delete_lifecycle_rule(args.prefix)
+        elif args.operation == "list":
+            list_lifecycle_rules()
+        elif args.operation == "expire":
+            expire_objects()
     else:
         parser.print_help()
 
@@ -0,0 +1,104 @@
+#!/usr/bin/env bash
+
+INPUT_FOLDER="in-files"
+OUTPUT_FOLDER="out-files"
+BASE_URL="http://localhost:8000"
+
+OBJECT_NAME="copy-test/object"
+COPY_NAME="copy-test/copy"
+MOVED_PREFIX="moved-test/"
+FILE_NAME="plan-etat-de-l-art.txt"
+FILE_PATH="$INPUT_FOLDER/$FILE_NAME"
+
+STEP=false
+
+usage() {
+    echo "Usage: $0 [options]"
+    echo "Options:"
+    echo "  --step, -s: Enable step-by-step mode"
+    exit 1
+}
+
+read_option() {
+    while [ "$#" -gt 0 ]; do
+        case "$1" in
+            --step | -s)
+                STEP=true
+                ;;
+            --help | -h)
+                usage
+                ;;
+            *)
+                return
+                ;;
+        esac
+        shift
+    done
+}
+
+check_server() {
+    echo "Checking if the server is running..."
+    response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/")
+    if [ "$response" -ne 200 ]; then
+        echo "Error: Server is not running (HTTP code: $response)"
+        exit 1
+    else
+        echo "Server is up and running!"
+    fi
+    echo
+}
+
+test_copy_move_restore() {
+    # PUT two versions
+    if $STEP; then
+        read -p "Press enter to PUT two versions"
+    fi
+    echo "=== Uploading two versions ==="
+    FIRST_VERSION=$(curl -s -X PUT -F "object=@$FILE_PATH" "$BASE_URL/objects/$OBJECT_NAME" | jq -r '.version_id')
+    echo "Second Version" | curl -s -X PUT -F "object=@-" "$BASE_URL/objects/$OBJECT_NAME"
+    echo
+
+    # COPY
+    if $STEP; then
+        read -p "Press enter to COPY the first version"
+    fi
+    echo "=== Copying first version ==="
+    python3 client.py copy "$OBJECT_NAME" "$COPY_NAME" --version_id "$FIRST_VERSION"
+    python3 client.py get "$COPY_NAME" "$OUTPUT_FOLDER/$FILE_NAME"
+    diff "$FILE_PATH" "$OUTPUT_FOLDER/$FILE_NAME" > /dev/null && echo "Files are identical." || echo "Files are different!"
+
+    # RESTORE
+    if $STEP; then
+        read -p "Press enter to RESTORE the first version"
+    fi
+    echo "=== Restoring first version ==="
+    python3 client.py restore "$OBJECT_NAME" "$FIRST_VERSION"
+    python3 client.py get "$OBJECT_NAME" "$OUTPUT_FOLDER/$FILE_NAME"
+    diff "$FILE_PATH" "$OUTPUT_FOLDER/$FILE_NAME" > /dev/null && echo "Files are identical." || echo "Files are different!"
+
+    # MOVE prefix
+    if $STEP; then
+        read -p "Press enter to MOVE the prefix"
+    fi
+    echo "=== Moving prefix ==="
+    python3 client.py move "copy-test/" "$MOVED_PREFIX" --prefix
+    python3 client.py list
+
+    # DELETE
+    if $STEP; then
+        read -p "Press enter to DELETE objects"
+    fi
+    echo "=== Deleting moved objects ==="
+    python3 client.py delete "${MOVED_PREFIX}object"
+    python3 client.py delete "${MOVED_PREFIX}copy"
+    rm -f "$OUTPUT_FOLDER/$FILE_NAME"
+}
+
+main() {
+    read_option "$@"
+    mkdir -p "$OUTPUT_FOLDER"
+    check_server
+    test_copy_move_restore
+}
+
+main "$@"
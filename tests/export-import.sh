@@ -0,0 +1,103 @@
+#!/usr/bin/env bash
+
+INPUT_FOLDER="in-files"
+OUTPUT_FOLDER="out-files"
+BASE_URL="http://localhost:8000"
+
+PREFIX="archive-test/"
+ARCHIVE_PATH="$OUTPUT_FOLDER/archive-test.tar"
+INPUT_FILES=("plan-etat-de-l-art.txt" "universite-evry.jpg")
+
+STEP=false
+
+usage() {
+    echo "Usage: $0 [options]"
+    echo "Options:"
+    echo "  --step, -s: Enable step-by-step mode"
+    exit 1
+}
+
+read_option() {
+    while [ "$#" -gt 0 ]; do
+        case "$1" in
+            --step | -s)
+                STEP=true
+                ;;
+            --help | -h)
+                usage
+                ;;
+            *)
+                return
+                ;;
+        esac
+        shift
+    done
+}
+
+check_server() {
+    echo "Checking if the server is running..."
+    response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/")
+    if [ "$response" -ne 200 ]; then
+        echo "Error: Server is not running (HTTP code: $response)"
+        exit 1
+    else
+        echo "Server is up and running!"
+    fi
+    echo
+}
+
+test_export_import() {
+    # PUT
+    if $STEP; then
+        read -p "Press enter to PUT objects"
+    fi
+    echo "=== Uploading objects ==="
+    for FILE_NAME in "${INPUT_FILES[@]}"; do
+        python3 client.py put "$PREFIX$FILE_NAME" "$INPUT_FOLDER/$FILE_NAME"
+    done
+
+    # EXPORT
+    if $STEP; then
+        read -p "Press enter to EXPORT the prefix"
+    fi
+    echo "=== Exporting prefix ==="
+    python3 client.py export "$ARCHIVE_PATH" --prefix "$PREFIX" --with_versions
+    tar tvf "$ARCHIVE_PATH"
+
+    # DELETE then IMPORT
+    if $STEP; then
+        read -p "Press enter to DELETE and IMPORT the objects"
+    fi
+    echo "=== Deleting and importing objects ==="
+    for FILE_NAME in "${INPUT_FILES[@]}"; do
+        python3 client.py delete "$PREFIX$FILE_NAME"
+    done
+    python3 client.py import "$ARCHIVE_PATH"
+
+    # GET and compare
+    echo "=== Comparing imported objects ==="
+    for FILE_NAME in "${INPUT_FILES[@]}"; do
+        python3 client.py get "$PREFIX$FILE_NAME" "$OUTPUT_FOLDER/$FILE_NAME"
+        diff "$INPUT_FOLDER/$FILE_NAME" "$OUTPUT_FOLDER/$FILE_NAME" > /dev/null && echo "Files are identical." || echo "Files are different!"
+    done
+
+    # DELETE
+    if $STEP; then
+        read -p "Press enter to DELETE objects"
+    fi
+    echo "=== Deleting objects ==="
+    for FILE_NAME in "${INPUT_FILES[@]}"; do
+        python3 client.py delete "$PREFIX$FILE_NAME"
+        rm -f "$OUTPUT_FOLDER/$FILE_NAME"
+    done
+    rm -f "$ARCHIVE_PATH"
+}
+
+main() {
+    read_option "$@"
+    mkdir -p "$OUTPUT_FOLDER"
+    check_server
+    test_export_import
+}
+
+main "$@"
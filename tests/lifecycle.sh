@@ -0,0 +1,107 @@
+#!/usr/bin/env bash
+
+INPUT_FOLDER="in-files"
+BASE_URL="http://localhost:8000"
+
+PREFIX="lifecycle-test/"
+OBJECT_NAME="${PREFIX}object"
+FILE_NAME="plan-etat-de-l-art.txt"
+FILE_PATH="$INPUT_FOLDER/$FILE_NAME"
+
+STEP=false
+
+usage() {
+    echo "Usage: $0 [options]"
+    echo "Options:"
+    echo "  --step, -s: Enable step-by-step mode"
+    exit 1
+}
+
+read_option() {
+    while [ "$#" -gt 0 ]; do
+        case "$1" in
+            --step | -s)
+                STEP=true
+                ;;
+            --help | -h)
+                usage
+                ;;
+            *)
+                return
+                ;;
+        esac
+        shift
+    done
+}
+
+check_server() {
+    echo "Checking if the server is running..."
+    response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/")
+    if [ "$response" -ne 200 ]; then
+        echo "Error: Server is not running (HTTP code: $response)"
+        exit 1
+    else
+        echo "Server is up and running!"
+    fi
+    echo
+}
+
+test_lifecycle() {
+    # PUT two versions
+    if $STEP; then
+        read -p "Press enter to PUT two versions"
+    fi
+    echo "=== Uploading two versions ==="
+    FIRST_VERSION=$(curl -s -X PUT -F "object=@$FILE_PATH" "$BASE_URL/objects/$OBJECT_NAME" | jq -r '.version_id')
+    echo "Second Version" | curl -s -X PUT -F "object=@-" "$BASE_URL/objects/$OBJECT_NAME"
+    echo
+
+    # Noncurrent versions expire immediately
+    if $STEP; then
+        read -p "Press enter to expire noncurrent versions"
+    fi
+    echo "=== Expiring noncurrent versions ==="
+    python3 client.py lifecycle update --prefix "$PREFIX" --noncurrent_expiration_days 0
+    python3 client.py lifecycle expire
+    response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/objects/$OBJECT_NAME?version_id=$FIRST_VERSION")
+    if [ "$response" -eq 404 ]; then
+        echo "First version has expired."
+    else
+        echo "First version has not expired! (HTTP code: $response)"
+    fi
+    response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/objects/$OBJECT_NAME")
+    if [ "$response" -eq 200 ]; then
+        echo "Current version is still there."
+    else
+        echo "Current version has expired! (HTTP code: $response)"
+    fi
+
+    # Current version expires immediately, the object is removed
+    if $STEP; then
+        read -p "Press enter to expire the current version"
+    fi
+    echo "=== Expiring current version ==="
+    python3 client.py lifecycle update --prefix "$PREFIX" --expiration_days 0
+    python3 client.py lifecycle expire
+    if curl -s "$BASE_URL/objects" | jq -e --arg name "$OBJECT_NAME" '.objects | index($name)' > /dev/null; then
+        echo "Object is still listed!"
+    else
+        echo "Object has expired."
+    fi
+
+    # DELETE rule
+    if $STEP; then
+        read -p "Press enter to DELETE the lifecycle rule"
+    fi
+    echo "=== Deleting lifecycle rule ==="
+    python3 client.py lifecycle delete --prefix "$PREFIX"
+    python3 client.py lifecycle list
+}
+
+main() {
+    read_option "$@"
+    check_server
+    test_lifecycle
+}
+
+main "$@"
@@ -0,0 +1,114 @@
+#!/usr/bin/env bash
+
+INPUT_FOLDER="in-files"
+BASE_URL="http://localhost:8000"
+
+PREFIX="policies-test/"
+OBJECT_NAME="${PREFIX}object"
+TXT_OBJECT_NAME="${PREFIX}file.txt"
+FILE_NAME="plan-etat-de-l-art.txt"
+FILE_PATH="$INPUT_FOLDER/$FILE_NAME"
+
+STEP=false
+
+usage() {
+    echo "Usage: $0 [options]"
+    echo "Options:"
+    echo "  --step, -s: Enable step-by-step mode"
+    exit 1
+}
+
+read_option() {
+    while [ "$#" -gt 0 ]; do
+        case "$1" in
+            --step | -s)
+                STEP=true
+                ;;
+            --help | -h)
+                usage
+                ;;
+            *)
+                return
+                ;;
+        esac
+        shift
+    done
+}
+
+check_server() {
+    echo "Checking if the server is running..."
+    response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/")
+    if [ "$response" -ne 200 ]; then
+        echo "Error: Server is not running (HTTP code: $response)"
+        exit 1
+    else
+        echo "Server is up and running!"
+    fi
+    echo
+}
+
+# Upload 3 versions of an object and print how many are still stored
+count_kept_versions() {
+    local object_name="$1"
+    local versions=()
+    for i in 1 2 3; do
+        echo "Version $i" | curl -s -X PUT -F "object=@-" "$BASE_URL/objects/$object_name" > /tmp/policies-test.json
+        versions+=("$(jq -r '.version_id' /tmp/policies-test.json)")
+    done
+    local kept=0
+    for version in "${versions[@]}"; do
+        response=$(curl --write-out "%{http_code}" --silent --output /dev/null "$BASE_URL/objects/$object_name?version_id=$version")
+        if [ "$response" -eq 200 ]; then
+            kept=$((kept + 1))
+        fi
+    done
+    rm -f /tmp/policies-test.json
+    echo "$kept"
+}
+
+test_policies() {
+    # Prefix and wildcard policies
+    if $STEP; then
+        read -p "Press enter to set prefix and wildcard policies"
+    fi
+    echo "=== Setting policies ==="
+    python3 client.py policy update --object_name "$PREFIX" --max_versions 2
+    python3 client.py policy update --object_name "${PREFIX}*.txt" --max_versions 1
+    python3 client.py policy list
+
+    # PUT 3 versions of each object
+    if $STEP; then
+        read -p "Press enter to PUT 3 versions of each object"
+    fi
+    echo "=== Uploading 3 versions of each object ==="
+    kept=$(count_kept_versions "$OBJECT_NAME")
+    if [ "$kept" -eq 2 ]; then
+        echo "Prefix policy applied: 2 versions kept."
+    else
+        echo "Prefix policy not applied: $kept versions kept!"
+    fi
+    kept=$(count_kept_versions "$TXT_OBJECT_NAME")
+    if [ "$kept" -eq 1 ]; then
+        echo "Wildcard policy applied: 1 version kept."
+    else
+        echo "Wildcard policy not applied: $kept versions kept!"
+    fi
+
+    # DELETE policies and objects
+    if $STEP; then
+        read -p "Press enter to DELETE policies and objects"
+    fi
+    echo "=== Deleting policies and objects ==="
+    python3 client.py policy delete --object_name "$PREFIX"
+    python3 client.py policy delete --object_name "${PREFIX}*.txt"
+    python3 client.py delete "$OBJECT_NAME"
+    python3 client.py delete "$TXT_OBJECT_NAME"
+}
+
+main() {
+    read_option "$@"
+    check_server
+    test_policies
+}
+
+main "$@"